@@ -30,6 +30,33 @@ screenshot_cache_dir = "./cache/screenshot_cache"
 screenshot_max_cache_size = 100
 screenshot_pool_size = 3  # Number of browser instances to maintain in pool
 
+# Shared so its in-memory screenshot cache survives across requests
+_screenshot_api: Optional[ScreenshotAPI] = None
+
+
+def get_screenshot_api() -> ScreenshotAPI:
+    global _screenshot_api
+
+    if _screenshot_api is None:
+        _screenshot_api = ScreenshotAPI(
+            cache_dir=screenshot_cache_dir,
+            max_cache_size=screenshot_max_cache_size,
+            pool_size=screenshot_pool_size,
+        )
+    return _screenshot_api
+
+
+# Created on first use so a missing KAGI_API_KEY only affects /kagi-search
+_kagi_service: Optional[KagiSearchService] = None
+
+
+def get_kagi_service() -> KagiSearchService:
+    global _kagi_service
+
+    if _kagi_service is None:
+        _kagi_service = KagiSearchService()
+    return _kagi_service
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -74,7 +101,9 @@ class ScreenshotPostRequest(BaseModel):
     width: int = 200
     height: int = 150
     full_page: bool = False
-    quality: int = 90
+    # quality and format only apply with use_cache off; cached screenshots are
+    # always stored and returned in the API's cache format
+    quality: int = 85
     format: str = "jpeg"
     use_cache: bool = True
 
@@ -83,13 +112,13 @@ class ThumbnailRequest(BaseModel):
     url: str
     width: int = 200
     height: int = 150
-    quality: int = 85
+    quality: int = 80
 
 
 class FullPageScreenshotRequest(BaseModel):
     url: str
     width: int = 1200
-    quality: int = 90
+    quality: int = 85
 
 
 class AutonomousPathRequest(BaseModel):
@@ -101,7 +130,8 @@ class AutonomousPathRequest(BaseModel):
 @app.get("/links", response_model=LinkSummary)
 async def get_links(url: str):
     try:
-        finder = SiteLinkFinder(url)
+        # Fetching and parsing the page is blocking; keep it off the event loop
+        finder = await asyncio.to_thread(SiteLinkFinder, url)
         summary = finder.get_summary()
         summary["regular_links"] = finder.regular_links_within_main_text
         return summary
@@ -124,9 +154,10 @@ async def kagi_search(request: KagiSearchRequest):
         List of search results with article information
     """
     try:
-        kagi_service = KagiSearchService()
+        kagi_service = get_kagi_service()
 
-        results = kagi_service.search(request)
+        # The Kagi client is synchronous; keep it off the event loop
+        results = await asyncio.to_thread(kagi_service.search, request)
 
         return results
 
@@ -138,13 +169,12 @@ async def kagi_search(request: KagiSearchRequest):
 async def take_screenshot(request: ScreenshotPostRequest):
     """
     Take a screenshot of a website and return it as an image response.
+
+    With use_cache set, the requested quality and format are ignored and the image is
+    returned in the cache format, as the Content-Type header reports.
     """
     try:
-        api = ScreenshotAPI(
-            cache_dir=screenshot_cache_dir,
-            max_cache_size=screenshot_max_cache_size,
-            pool_size=screenshot_pool_size,
-        )
+        api = get_screenshot_api()
 
         screenshot_bytes = await api.get_screenshot(
             url=request.url,
@@ -156,7 +186,9 @@ async def take_screenshot(request: ScreenshotPostRequest):
             use_cache=request.use_cache,
         )
 
-        content_type = f"image/{request.format}"
+        # Cached screenshots are re-encoded to the cache format
+        image_format = api.cache_format if request.use_cache else request.format
+        content_type = f"image/{image_format}"
         return Response(
             content=screenshot_bytes,
             media_type=content_type,
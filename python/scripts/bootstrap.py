@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Bootstrap script for the Website Screenshot Service.
+Installs the Python requirements and the Playwright browsers from a single
+interpreter instead of spawning one `python -m ...` process per step.
+"""
+
+import importlib
+import sys
+
+
+def install_requirements(requirements_file):
+    from pip._internal.cli.main import main as pip_main
+
+    return pip_main(["install", "-r", requirements_file])
+
+
+def install_browsers():
+    # Playwright may have just been installed by pip in this same process
+    importlib.invalidate_caches()
+    from playwright.__main__ import main as playwright_main
+
+    sys.argv = ["playwright", "install"]
+    try:
+        playwright_main()
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
+def main():
+    requirements_file = sys.argv[1] if len(sys.argv) > 1 else "requirements.txt"
+
+    exit_code = install_requirements(requirements_file)
+    if exit_code != 0:
+        print(f"❌ pip install failed with exit code {exit_code}", file=sys.stderr)
+        return exit_code
+
+    exit_code = install_browsers()
+    if exit_code != 0:
+        print(f"❌ playwright install failed with exit code {exit_code}", file=sys.stderr)
+        return exit_code
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
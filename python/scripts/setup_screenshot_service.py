@@ -27,41 +27,26 @@ def run_command(command, description):
 def check_python_version():
     print("🐍 Checking Python version...")
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print(f"❌ Python 3.8+ required, found {version.major}.{version.minor}")
+    if version.major < 3 or (version.major == 3 and version.minor < 9):
+        print(f"❌ Python 3.9+ required, found {version.major}.{version.minor}")
         return False
     print(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
     return True
 
 
 def install_dependencies():
-    print("\n📦 Installing Python dependencies...")
+    print("\n📦 Installing Python dependencies and Playwright browsers...")
 
     requirements_file = Path("requirements.txt")
     if not requirements_file.exists():
         print("❌ requirements.txt not found")
         return False
 
+    # pip and playwright run inside one interpreter to pay startup cost once
+    bootstrap_script = Path(__file__).with_name("bootstrap.py")
     if not run_command(
-        f"{sys.executable} -m pip install -r requirements.txt",
-        "Installing Python packages",
-    ):
-        return False
-
-    return True
-
-
-def install_playwright():
-    print("\n🌐 Installing Playwright...")
-
-    if not run_command(
-        f"{sys.executable} -m playwright install", "Installing Playwright browsers"
-    ):
-        return False
-
-    if not run_command(
-        f"{sys.executable} -m playwright install chromium",
-        "Installing Chromium browser",
+        f'"{sys.executable}" "{bootstrap_script}" "{requirements_file}"',
+        "Installing Python packages and browsers",
     ):
         return False
 
@@ -74,12 +59,8 @@ def create_directories():
     directories = ["screenshot_cache", "logs"]
 
     for directory in directories:
-        path = Path(directory)
-        if not path.exists():
-            path.mkdir(parents=True, exist_ok=True)
-            print(f"✅ Created directory: {directory}")
-        else:
-            print(f"ℹ️  Directory already exists: {directory}")
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        print(f"✅ Ensured directory: {directory}")
 
     return True
 
@@ -90,8 +71,13 @@ def test_installation():
     try:
         import asyncio
 
+        # The shared helpers live in the package root, one level above scripts/
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+        from utils.event_loop import install_fast_event_loop
         from website_screenshot_service import WebsiteScreenshotService
 
+        install_fast_event_loop()
+
         async def test_screenshot():
             try:
                 async with WebsiteScreenshotService() as service:
@@ -146,10 +132,6 @@ def main():
         print("\n❌ Failed to install dependencies")
         sys.exit(1)
 
-    if not install_playwright():
-        print("\n❌ Failed to install Playwright")
-        sys.exit(1)
-
     if not create_directories():
         print("\n❌ Failed to create directories")
         sys.exit(1)
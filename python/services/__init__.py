@@ -7,6 +7,7 @@ from services.website_screenshot_service import (
     WebsiteScreenshotService,
     ScreenshotAPI,
     BrowserPool,
+    ContextPool,
     get_browser_pool,
     shutdown_browser_pool,
     take_screenshot,
@@ -18,6 +19,7 @@ __all__ = [
     "WebsiteScreenshotService",
     "ScreenshotAPI",
     "BrowserPool",
+    "ContextPool",
     "get_browser_pool",
     "shutdown_browser_pool",
     "take_screenshot",
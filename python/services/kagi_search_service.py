@@ -2,6 +2,7 @@
 This module provides a KagiSearchService class to search for articles containing specific links.
 """
 
+import asyncio
 import json
 import os
 from dataclasses import dataclass
@@ -71,6 +72,24 @@ class KagiSearchService:
             results=results,
         )
 
+    async def search_many(
+        self, requests: List[KagiSearchRequest]
+    ) -> List[KagiSearchResult]:
+        """
+        Run several searches concurrently.
+
+        The Kagi client is synchronous, so each search runs in a worker thread.
+
+        Args:
+            requests (List[KagiSearchRequest]): The searches to run
+
+        Returns:
+            List[KagiSearchResult]: Results in the same order as requests
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.search, request) for request in requests)
+        )
+
     def search_for_link_mentions(
         self, target_url: str, limit: int = 10, exclude_domain: bool = True
     ) -> List[SearchResult]:
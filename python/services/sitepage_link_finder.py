@@ -2,12 +2,31 @@
 This module provides a SiteLinkFinder class to find all links within a given site page.
 """
 
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup, Tag
 from typing import List, Optional, Dict, Set
 from urllib.parse import urljoin, urlparse
 import re
 
+# The C-based lxml tree builder is several times faster than html.parser. lxml is
+# pinned in requirements.txt so every environment parses pages the same way
+_PARSER = "lxml"
+
+# Image file extensions and common image/media path segments, in a single pass
+_IMG_RE = re.compile(
+    r"\.(?:jpe?g|png|gif|webp)(?:$|[?#])|/(?:images|media|img|picture|photos?)/|unsplash"
+)
+
+# Shared session so crawling many pages reuses kept-alive connections per host. It is
+# used by every request, so it must not carry cookies from one crawled site into
+# another user's fetches; the policy rejects them all, as a bare requests.get would
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 
 class SiteLinkFinder:
     """
@@ -22,21 +41,16 @@ class SiteLinkFinder:
             url (str): The URL of the page to analyze
         """
         self.url = url
-        self._link_blacklist = [
-            "\\",
-            "/",
-            "#",
+        self._link_blacklist = frozenset(["\\", "/", "#"])
+        # Non-navigational schemes, rejected by prefix rather than exact match
+        self._blacklisted_schemes = (
             "mailto:",
             "tel:",
             "javascript:",
             "data:",
             "whatsapp:",
             "sms:",
-            "tel:",
-            "javascript:",
-            "javascript:void(0)",
-            "javascript:void(0);",
-        ]
+        )
 
         self._main_content_selectors = [
             "article",
@@ -48,17 +62,6 @@ class SiteLinkFinder:
             ".article-body",
         ]
 
-        self._image_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
-        self._img_link_filter = [
-            "/images/",
-            "/media/",
-            "/img/",
-            "/picture/",
-            "/photo/",
-            "/photos/",
-            "unsplash",
-        ]
-
         # Initialize properties
         self._soup = None
         self._main_content = None
@@ -76,10 +79,14 @@ class SiteLinkFinder:
     def _fetch_page(self) -> None:
         """Fetch the webpage and create BeautifulSoup object."""
         try:
-            response = requests.get(self.url, timeout=10)
+            response = _SESSION.get(self.url, timeout=10)
             response.raise_for_status()
-            html_content = response.text
-            self._soup = BeautifulSoup(html_content, "html.parser")
+            # Hand the parser raw bytes; it reads the encoding from the document's
+            # meta charset instead of requests guessing it over the whole body. A
+            # charset in the Content-Type header takes precedence, as in browsers
+            content_type = response.headers.get("Content-Type", "").lower()
+            encoding = response.encoding if "charset=" in content_type else None
+            self._soup = BeautifulSoup(response.content, _PARSER, from_encoding=encoding)
         except Exception as e:
             raise Exception(f"Failed to fetch page {self.url}: {str(e)}")
 
@@ -98,7 +105,7 @@ class SiteLinkFinder:
         if not url or url.strip() == "":
             return False
 
-        if url in self._link_blacklist:
+        if url in self._link_blacklist or url.startswith(self._blacklisted_schemes):
             return False
 
         if url.startswith("#") or url == "/":
@@ -123,9 +130,18 @@ class SiteLinkFinder:
         if not self._soup:
             return
         self._main_content = self._find_main_content()
-        self._all_links = self._soup.find_all("a")
+        anchors = self._soup.find_all("a")
+        self._all_links = [str(link.get("href") or "") for link in anchors]
+
+        # Collect the main-content anchors once so classification is a set lookup
+        # rather than a walk of the main-content subtree for every link
+        main_anchor_ids = (
+            {id(a) for a in self._main_content.find_all("a", href=True)}
+            if self._main_content
+            else set()
+        )
 
-        for link in self._all_links:
+        for link in anchors:
             if isinstance(link, Tag) and link.has_attr("href"):
                 href = link.get("href")
 
@@ -135,16 +151,14 @@ class SiteLinkFinder:
                 # Normalize the URL
                 normalized_url = self._normalize_url(str(href))
 
-                if self._main_content and link in self._main_content.descendants:
+                if id(link) in main_anchor_ids:
                     self._main_text_links.append(normalized_url)
                 else:
                     self._other_links.append(normalized_url)
 
         # Categorize main text links
         for link in self._main_text_links:
-            if any(ext in link for ext in self._image_extensions) or any(
-                filter in link for filter in self._img_link_filter
-            ):
+            if _IMG_RE.search(link):
                 self._img_links_within_main_text.append(link)
             else:
                 self._regular_links_within_main_text.append(link)
@@ -152,9 +166,15 @@ class SiteLinkFinder:
         # Store all valid links
         self._valid_links = self._main_text_links + self._other_links
 
+        # Only the extracted URLs are kept. Free the parse tree now rather than when the
+        # finder is collected, so a PathFinder crawl doesn't hold one DOM per level
+        self._soup.decompose()
+        self._soup = None
+        self._main_content = None
+
     @property
     def all_links(self) -> List[str]:
-        """Get all links found on the page (excluding blacklisted ones)."""
+        """Get the href of every link on the page, before any filtering."""
         return self._all_links
 
     @property
@@ -5,15 +5,19 @@ Provides high-quality screenshots of websites with various customization options
 
 import asyncio
 import base64
+import functools
+import hashlib
 import io
 import logging
+import os
 import platform
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, Union, List
 from urllib.parse import urlparse
 import time
-from collections import deque
+from collections import deque, OrderedDict
+from contextlib import asynccontextmanager
 import threading
 
 if platform.system() == "Windows":
@@ -23,7 +27,7 @@ if platform.system() == "Windows":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 try:
-    from playwright.async_api import async_playwright, Browser, Page
+    from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 except ImportError:
     print("Playwright not installed. Installing required dependencies...")
     import subprocess
@@ -31,11 +35,135 @@ except ImportError:
 
     subprocess.check_call([sys.executable, "-m", "pip", "install", "playwright"])
     subprocess.check_call([sys.executable, "-m", "playwright", "install", "chromium"])
-    from playwright.async_api import async_playwright, Browser, Page
+    from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+from PIL import Image, ImageDraw, ImageFont
+
+if not __package__:
+    # Run as a script: add the parent directory to Python path, as the tests do, so
+    # the top-level packages can be imported
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.url import normalize_url
+
+try:
+    _DEFAULT_FONT = ImageFont.load_default()
+except Exception:
+    _DEFAULT_FONT = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Format and quality of images stored by ScreenshotAPI's cache, overridable by operators
+CACHE_FORMAT = os.getenv("SCREENSHOT_CACHE_FORMAT", "webp").lower()
+CACHE_QUALITY = int(os.getenv("SCREENSHOT_CACHE_QUALITY", "80"))
+
+# Resource types aborted when a capture is made with block_resources=True. Stylesheets
+# are allowed through: an unstyled page makes a misleading thumbnail
+BLOCKED = frozenset({"image", "media", "font"})
+
+
+def _placeholder_domain(url: str) -> str:
+    try:
+        return urlparse(url).netloc
+    except Exception:
+        return "Unknown"
+
+
+# Per-thread encode buffer for placeholders; getvalue() copies, so it can be reused
+_tls = threading.local()
+
+
+@functools.lru_cache(maxsize=128)
+def _make_placeholder(domain: str, width: int, height: int, fmt: str = "jpeg") -> bytes:
+    """Render the "Preview <domain>" placeholder image, cached per size and domain."""
+    img = Image.new("RGB", (width, height), color="#f0f0f0")
+    draw = ImageDraw.Draw(img)
+
+    text = f"Preview\n{domain}"
+    bbox = draw.textbbox((0, 0), text, font=_DEFAULT_FONT)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2
+
+    draw.text((x, y), text, fill="#666666", font=_DEFAULT_FONT)
+
+    img_byte_arr = getattr(_tls, "buf", None)
+    if img_byte_arr is None:
+        img_byte_arr = _tls.buf = io.BytesIO()
+    img_byte_arr.seek(0)
+    img_byte_arr.truncate(0)
+    if fmt == "webp":
+        img.save(img_byte_arr, format="WEBP", quality=80, method=0)
+    elif fmt == "png":
+        img.save(img_byte_arr, format="PNG")
+    else:
+        img.save(img_byte_arr, format="JPEG", quality=85)
+    return img_byte_arr.getvalue()
+
+
+def _encode_webp(image_bytes: bytes, quality: int) -> bytes:
+    img = Image.open(io.BytesIO(image_bytes))
+    if img.format == "WEBP":
+        return image_bytes
+    out = io.BytesIO()
+    # method=0 is the fastest WebP encoder setting, still ~30% smaller than JPEG
+    img.save(out, format="WEBP", quality=quality, method=0)
+    return out.getvalue()
+
+
+async def _capture(
+    page: Page,
+    full_page: bool,
+    quality: int,
+    format: str,
+    path: Optional[Union[str, Path]] = None,
+) -> bytes:
+    """
+    Screenshot a loaded page in the requested format.
+
+    Playwright only encodes png and jpeg, so webp is captured losslessly as png and
+    transcoded with Pillow off the event loop.
+    """
+    screenshot_options: Dict[str, Any] = {
+        "full_page": full_page,
+        "type": "png" if format == "webp" else format,
+    }
+    # Playwright rejects a quality setting for png
+    if format == "jpeg":
+        screenshot_options["quality"] = quality
+    if path and format != "webp":
+        screenshot_options["path"] = path
+
+    screenshot_bytes = await page.screenshot(**screenshot_options)
+
+    if format == "webp":
+        screenshot_bytes = await asyncio.to_thread(
+            _encode_webp, screenshot_bytes, quality
+        )
+        if path:
+            await asyncio.to_thread(Path(path).write_bytes, screenshot_bytes)
+    return screenshot_bytes
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class BrowserPool:
     """
@@ -248,23 +376,124 @@ async def shutdown_browser_pool():
             _browser_pool = None
 
 
+class ContextPool:
+    """
+    A pool of reusable browser contexts, each with its own page.
+    """
+
+    def __init__(self, browser: Browser, size: int = 4):
+        """
+        Initialize the context pool.
+
+        Args:
+            browser (Browser): Browser to create the contexts in
+            size (int): Maximum number of context/page pairs, i.e. the maximum number
+                of screenshots in flight at once
+        """
+        self.browser = browser
+        self.size = size
+        # Slots are created on first demand, so one-shot services only pay for one
+        self._sem = asyncio.Semaphore(size)
+        # Idle slots keyed by whether their context blocks heavy resources
+        self._idle: Dict[bool, List[tuple]] = {True: [], False: []}
+        self._contexts: List[BrowserContext] = []
+
+    async def _new_slot(self, block_resources: bool) -> tuple:
+        context = await self.browser.new_context(user_agent=DEFAULT_USER_AGENT)
+        try:
+            if block_resources:
+                # Installed once for the context's lifetime; plain contexts never
+                # intercept requests, which would also bypass Chromium's HTTP cache
+                await context.route("**/*", _block_heavy_resources)
+            page = await context.new_page()
+        except Exception:
+            await self._discard(context)
+            raise
+        self._contexts.append(context)
+        return context, page
+
+    async def _discard(self, context: BrowserContext):
+        if context in self._contexts:
+            self._contexts.remove(context)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser context: {e}")
+
+    async def _reset(self, context: BrowserContext, page: Page) -> bool:
+        """Reset a slot for the next caller; False if it is no longer usable."""
+        try:
+            await page.goto("about:blank")
+            await context.clear_cookies()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled page, discarding it: {e}")
+            return False
+
+    @asynccontextmanager
+    async def acquire(self, block_resources: bool = False):
+        """
+        Borrow an idle (context, page) pair, creating one if none is idle and the pool
+        is below size, and waiting otherwise.
+
+        With block_resources, the pair's context aborts image, media and font
+        requests. If every idle slot is of the other kind and the pool is full, one of
+        them is closed to make room.
+
+        Creating a slot can fail (e.g. the browser crashed); that error is raised to
+        the caller straight away. Releasing never raises: a slot that can't be reset
+        is closed and its place freed for a fresh one.
+        """
+        async with self._sem:
+            idle = self._idle[block_resources]
+            if idle:
+                context, page = idle.pop()
+            else:
+                spare = self._idle[not block_resources]
+                if len(self._contexts) >= self.size and spare:
+                    await self._discard(spare.pop()[0])
+                context, page = await self._new_slot(block_resources)
+            try:
+                yield context, page
+            finally:
+                if await self._reset(context, page):
+                    idle.append((context, page))
+                else:
+                    await self._discard(context)
+
+    async def close(self):
+        """Close every context in the pool."""
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close browser context: {e}")
+        self._contexts.clear()
+        for idle in self._idle.values():
+            idle.clear()
+
+
 class WebsiteScreenshotService:
     """
     A service for taking high-quality screenshots of websites using Playwright.
     """
 
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    def __init__(self, headless: bool = True, timeout: int = 30000, max_pages: int = 4):
         """
         Initialize the screenshot service.
 
         Args:
             headless (bool): Whether to run browser in headless mode
             timeout (int): Timeout for page operations in milliseconds
+            max_pages (int): Maximum number of pooled pages, created on demand, which
+                caps concurrent screenshots
         """
         self.headless = headless
         self.timeout = timeout
+        self.max_pages = max_pages
         self.browser: Optional[Browser] = None
         self.playwright = None
+        self._pool: Optional[ContextPool] = None
 
     async def __aenter__(self):
         await self.start()
@@ -307,7 +536,12 @@ class WebsiteScreenshotService:
                 else:
                     raise Exception(f"Could not start playwright: {e}")
 
+            self._pool = ContextPool(self.browser, size=self.max_pages)
+
     async def stop(self):
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
         if self.browser:
             await self.browser.close()
             self.browser = None
@@ -322,12 +556,15 @@ class WebsiteScreenshotService:
         width: int = 1200,
         height: int = 800,
         full_page: bool = False,
-        quality: int = 90,
+        quality: int = 85,
         format: str = "jpeg",
         wait_for: Optional[str] = None,
         wait_time: int = 2000,
         user_agent: Optional[str] = None,
         viewport: Optional[Dict[str, int]] = None,
+        path: Optional[Union[str, Path]] = None,
+        wait_until: str = "domcontentloaded",
+        block_resources: bool = False,
         **kwargs,
     ) -> bytes:
         """
@@ -339,11 +576,20 @@ class WebsiteScreenshotService:
             height (int): Viewport height
             full_page (bool): Whether to capture the full page
             quality (int): Image quality (1-100)
-            format (str): Image format ('jpeg', 'png', 'webp')
+            format (str): Image format ('jpeg', 'png', 'webp'). 'png' is lossless and
+                several times larger; 'webp' is smallest but adds a Pillow transcode
             wait_for (str): CSS selector to wait for before taking screenshot
             wait_time (int): Time to wait after page load (ms)
             user_agent (str): Custom user agent string
             viewport (dict): Custom viewport settings
+            path (str|Path): If set, the image is also written to this file as
+                part of the capture
+            wait_until (str): Navigation event to wait for before capturing.
+                "domcontentloaded" is fast but may miss late-loading content; use
+                wait_for/wait_time for that, or "networkidle" for pages that need
+                every request to settle (much slower on ad-heavy sites)
+            block_resources (bool): Abort image, media and font requests while
+                loading the page; stylesheets still load so the layout is kept
             **kwargs: Additional page options
 
         Returns:
@@ -352,72 +598,76 @@ class WebsiteScreenshotService:
         if not self.browser:
             await self.start()
 
-        page = await self.browser.new_page()  # type: ignore
-
-        try:
-            if viewport:
-                await page.set_viewport_size(viewport)  # type: ignore
-            else:
-                await page.set_viewport_size({"width": width, "height": height})  # type: ignore
-
-            if user_agent:
-                await page.set_extra_http_headers({"User-Agent": user_agent})
+        async with self._pool.acquire(block_resources) as (context, page):  # type: ignore
+            try:
+                if viewport:
+                    await page.set_viewport_size(viewport)  # type: ignore
+                else:
+                    await page.set_viewport_size({"width": width, "height": height})  # type: ignore
 
-            else:
-                await page.set_extra_http_headers(
-                    {
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    }
-                )
+                if user_agent:
+                    await page.set_extra_http_headers({"User-Agent": user_agent})
 
-            logger.info(f"Navigating to {url}")
-            await page.goto(url, timeout=self.timeout, wait_until="networkidle")
+                else:
+                    await page.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
 
-            if wait_for:
-                logger.info(f"Waiting for element: {wait_for}")
-                await page.wait_for_selector(wait_for, timeout=self.timeout)
+                logger.info(f"Navigating to {url}")
+                await page.goto(url, timeout=self.timeout, wait_until=wait_until)
 
-            if wait_time > 0:
-                await page.wait_for_timeout(wait_time)
+                if wait_for:
+                    logger.info(f"Waiting for element: {wait_for}")
+                    await page.wait_for_selector(wait_for, timeout=self.timeout)
 
-            logger.info("Taking screenshot...")
-            screenshot_options = {
-                "full_page": full_page,
-                "quality": quality,
-                "type": format,
-            }
+                if wait_time > 0:
+                    await page.wait_for_timeout(wait_time)
 
-            screenshot_bytes = await page.screenshot(**screenshot_options)
-            logger.info(f"Screenshot taken successfully ({len(screenshot_bytes)} bytes)")
+                logger.info("Taking screenshot...")
+                screenshot_bytes = await _capture(page, full_page, quality, format, path)
+                logger.info(
+                    f"Screenshot taken successfully ({len(screenshot_bytes)} bytes)"
+                )
 
-            return screenshot_bytes
+                return screenshot_bytes
 
-        except Exception as e:
-            logger.error(f"Error taking screenshot of {url}: {str(e)}")
-            try:
-                return self._generate_placeholder_sync(url, width, height)
-            except Exception as placeholder_error:
-                logger.error(f"Failed to generate placeholder: {placeholder_error}")
-                raise e
-        finally:
-            try:
-                await page.close()
-            except Exception as close_error:
-                logger.warning(f"Failed to close page: {close_error}")
-
-    async def take_screenshot_as_base64(self, url: str, **kwargs) -> str:
+            except Exception as e:
+                logger.error(f"Error taking screenshot of {url}: {str(e)}")
+                try:
+                    placeholder = self._generate_placeholder_sync(
+                        url, width, height, format
+                    )
+                    if path:
+                        await asyncio.to_thread(Path(path).write_bytes, placeholder)
+                    return placeholder
+                except Exception as placeholder_error:
+                    logger.error(f"Failed to generate placeholder: {placeholder_error}")
+                    raise e
+
+    async def take_screenshot_as_base64(
+        self, url: str, data_url: bool = False, **kwargs
+    ) -> str:
         """
         Take a screenshot and return it as a base64 string.
 
+        Prefer take_screenshot when the caller can use raw bytes; encoding copies the
+        whole image and grows it by a third.
+
         Args:
             url (str): The URL to screenshot
+            data_url (bool): Return a ready-to-use "data:image/...;base64," URL
             **kwargs: Arguments passed to take_screenshot
 
         Returns:
             str: Base64 encoded screenshot
         """
         screenshot_bytes = await self.take_screenshot(url, **kwargs)
-        return base64.b64encode(screenshot_bytes).decode("utf-8")
+        if pybase64 is not None:
+            encoded = pybase64.b64encode_as_string(screenshot_bytes)
+        else:
+            encoded = base64.b64encode(screenshot_bytes).decode("ascii")
+
+        if data_url:
+            return f"data:image/{kwargs.get('format', 'jpeg')};base64,{encoded}"
+        return encoded
 
     async def take_screenshot_to_file(
         self, url: str, output_path: Union[str, Path], **kwargs
@@ -433,34 +683,39 @@ class WebsiteScreenshotService:
         Returns:
             Path: Path to the saved screenshot
         """
-        screenshot_bytes = await self.take_screenshot(url, **kwargs)
-
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "wb") as f:
-            f.write(screenshot_bytes)
+        # The capture writes the file via path=, so there is no separate save step
+        await self.take_screenshot(url, path=output_path, **kwargs)
 
         logger.info(f"Screenshot saved to {output_path}")
         return output_path
 
     async def take_thumbnail(
-        self, url: str, width: int = 200, height: int = 150, **kwargs
+        self, url: str, width: int = 200, height: int = 150, quality: int = 80, **kwargs
     ) -> bytes:
         """
         Take a small thumbnail screenshot.
 
+        Images, media and fonts are blocked by default (block_resources=True), so
+        pictures on the page render as empty boxes; pass block_resources=False to
+        keep them.
+
         Args:
             url (str): The URL to screenshot
             width (int): Thumbnail width
             height (int): Thumbnail height
+            quality (int): JPEG quality
             **kwargs: Additional arguments passed to take_screenshot
 
         Returns:
             bytes: Thumbnail image data
         """
+        kwargs.setdefault("wait_until", "domcontentloaded")
+        kwargs.setdefault("block_resources", True)
         return await self.take_screenshot(
-            url, width=width, height=height, full_page=False, **kwargs
+            url, width=width, height=height, full_page=False, quality=quality, **kwargs
         )
 
     async def take_full_page_screenshot(
@@ -479,37 +734,11 @@ class WebsiteScreenshotService:
         """
         return await self.take_screenshot(url, width=width, full_page=True, **kwargs)
 
-    def _generate_placeholder_sync(self, url: str, width: int, height: int) -> bytes:
+    def _generate_placeholder_sync(
+        self, url: str, width: int, height: int, fmt: str = "jpeg"
+    ) -> bytes:
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import io
-
-            img = Image.new("RGB", (width, height), color="#f0f0f0")
-            draw = ImageDraw.Draw(img)
-
-            try:
-                domain = urlparse(url).netloc
-            except:
-                domain = "Unknown"
-
-            text = f"Preview\n{domain}"
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            x = (width - text_width) // 2
-            y = (height - text_height) // 2
-
-            draw.text((x, y), text, fill="#666666", font=font)
-
-            img_byte_arr = io.BytesIO()
-            img.save(img_byte_arr, format="JPEG", quality=85)
-            return img_byte_arr.getvalue()
+            return _make_placeholder(_placeholder_domain(url), width, height, fmt)
         except Exception as e:
             logger.error(f"Failed to generate placeholder: {e}")
             # Return a minimal placeholder
@@ -526,6 +755,9 @@ class ScreenshotAPI:
         cache_dir: Optional[str] = None,
         max_cache_size: int = 100,
         pool_size: int = 3,
+        cache_format: Optional[str] = None,
+        cache_quality: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
     ):
         """
         Initialize the screenshot API.
@@ -534,11 +766,29 @@ class ScreenshotAPI:
             cache_dir (str): Directory to cache screenshots
             max_cache_size (int): Maximum number of cached screenshots
             pool_size (int): Number of browser instances in the pool
+            cache_format (str): Format cached screenshots are stored and returned in,
+                'webp' or 'jpeg' (defaults to SCREENSHOT_CACHE_FORMAT, else 'webp')
+            cache_quality (int): Encoder quality for cached screenshots (defaults to
+                SCREENSHOT_CACHE_QUALITY, else 80)
+            max_concurrent (int): Maximum screenshots rendered at once (defaults to
+                pool_size, so callers queue instead of overflowing the browser pool)
         """
         self.cache_dir = Path(cache_dir) if cache_dir else Path("./screenshot_cache")
         self.max_cache_size = max_cache_size
         self.pool_size = pool_size
+        self.cache_format = (cache_format or CACHE_FORMAT).lower()
+        if self.cache_format not in ("webp", "jpeg"):
+            raise ValueError(f"Unsupported cache format: {self.cache_format}")
+        self.cache_quality = cache_quality or CACHE_QUALITY
+        self._cache_ext = "jpg" if self.cache_format == "jpeg" else self.cache_format
+        self.max_concurrent = max_concurrent or pool_size
+        self._sem = asyncio.Semaphore(self.max_concurrent)
         self.cache_dir.mkdir(exist_ok=True)
+        # Hot screenshots kept in memory, least recently used first
+        self._mem: "OrderedDict[str, bytes]" = OrderedDict()
+        self._mem_max = 64
+        # Files on disk, oldest write first, so eviction never rescans the directory
+        self._index = self._load_cache_index()
 
     async def get_screenshot(
         self,
@@ -556,17 +806,83 @@ class ScreenshotAPI:
             width (int): Screenshot width
             height (int): Screenshot height
             use_cache (bool): Whether to use caching
-            **kwargs: Additional arguments for screenshot
+            **kwargs: Additional arguments for screenshot. With use_cache set, format
+                and quality are ignored in favor of cache_format and cache_quality
 
         Returns:
-            bytes: Screenshot image data
+            bytes: Screenshot image data, in cache_format when use_cache is set
         """
         if use_cache:
-            cached = self._get_cached_screenshot(url, width, height)
+            cached = await self._get_cached_screenshot(url, width, height)
             if cached:
                 logger.info(f"Using cached screenshot for {url}")
                 return cached
 
+        # Only cache misses need a browser; bound how many run at once
+        async with self._sem:
+            return await self._render_screenshot(url, width, height, use_cache, **kwargs)
+
+    async def get_screenshots(
+        self,
+        urls: List[str],
+        width: int = 200,
+        height: int = 150,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> List[bytes]:
+        """
+        Get screenshots of several URLs concurrently.
+
+        Args:
+            urls (List[str]): The URLs to screenshot
+            width (int): Screenshot width
+            height (int): Screenshot height
+            use_cache (bool): Whether to use caching
+            **kwargs: Additional arguments for screenshot
+
+        Returns:
+            List[bytes]: Screenshot image data, in the same order as urls
+        """
+        # Repeated URLs are rendered once; get_screenshot's semaphore bounds how
+        # many of the unique ones render at once
+        unique = list(dict.fromkeys(urls))
+        if sys.version_info >= (3, 11):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(
+                            self.get_screenshot(url, width, height, use_cache, **kwargs)
+                        )
+                        for url in unique
+                    ]
+            except ExceptionGroup as eg:
+                # Raise the first error itself, as the gather fallback does, so
+                # callers see the same exception type on every Python version
+                raise eg.exceptions[0]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(
+                *(
+                    self.get_screenshot(url, width, height, use_cache, **kwargs)
+                    for url in unique
+                )
+            )
+
+        by_url = dict(zip(unique, results))
+        return [by_url[url] for url in urls]
+
+    async def _render_screenshot(
+        self, url: str, width: int, height: int, use_cache: bool, **kwargs
+    ) -> bytes:
+        """Take a screenshot with a pooled browser and cache it if requested."""
+        if use_cache:
+            # Capture losslessly so the cache encode is the only lossy step; webp
+            # captures come back already encoded at cache_quality
+            kwargs = {
+                **kwargs,
+                "format": "webp" if self.cache_format == "webp" else "png",
+                "quality": self.cache_quality,
+            }
         # Get browser from pool
         browser = None
         pool = None
@@ -596,13 +912,18 @@ class ScreenshotAPI:
                 browser = None  # Prevent cleanup in finally block
 
             if use_cache:
-                self._cache_screenshot(url, width, height, screenshot)
+                screenshot = await self._cache_screenshot(url, width, height, screenshot)
 
             return screenshot
 
         except Exception as e:
             logger.error(f"Failed to get screenshot for {url}: {e}")
-            return self._generate_placeholder(url, width, height)
+            return self._generate_placeholder(
+                url,
+                width,
+                height,
+                self.cache_format if use_cache else kwargs.get("format", "jpeg"),
+            )
         finally:
             # Cleanup browser if it wasn't returned to pool
             if browser and pool:
@@ -628,34 +949,37 @@ class ScreenshotAPI:
 
         try:
             await page.set_viewport_size({"width": width, "height": height})
-            await page.set_extra_http_headers(
-                {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                }
-            )
+            await page.set_extra_http_headers({"User-Agent": DEFAULT_USER_AGENT})
 
             logger.info(f"Navigating to {url}")
-            await page.goto(url, timeout=30000, wait_until="networkidle")
+            # Same default as take_screenshot; pass wait_until="networkidle" for
+            # pages that keep loading content after the DOM is ready
+            await page.goto(
+                url,
+                timeout=30000,
+                wait_until=kwargs.get("wait_until", "domcontentloaded"),
+            )
 
             wait_time = kwargs.get("wait_time", 2000)
             if wait_time > 0:
                 await page.wait_for_timeout(wait_time)
 
             logger.info("Taking screenshot...")
-            screenshot_options = {
-                "full_page": kwargs.get("full_page", False),
-                "quality": kwargs.get("quality", 90),
-                "type": kwargs.get("format", "jpeg"),
-            }
-
-            screenshot_bytes = await page.screenshot(**screenshot_options)
+            screenshot_bytes = await _capture(
+                page,
+                kwargs.get("full_page", False),
+                kwargs.get("quality", 85),
+                kwargs.get("format", "jpeg"),
+            )
             logger.info(f"Screenshot taken successfully ({len(screenshot_bytes)} bytes)")
 
             return screenshot_bytes
 
         except Exception as e:
             logger.error(f"Error taking screenshot of {url}: {str(e)}")
-            return self._generate_placeholder(url, width, height)
+            return self._generate_placeholder(
+                url, width, height, kwargs.get("format", "jpeg")
+            )
         finally:
             try:
                 await page.close()
@@ -667,78 +991,125 @@ class ScreenshotAPI:
         await shutdown_browser_pool()
 
     def _get_cache_key(self, url: str, width: int, height: int) -> str:
-        import hashlib
-
-        key_data = f"{url}_{width}_{height}".encode("utf-8")
-        return hashlib.md5(key_data).hexdigest()
+        # NUL separators keep e.g. ("a", 1, 23) and ("a", 12, 3) apart
+        key_data = f"{normalize_url(url)}\0{width}\0{height}".encode("utf-8")
+        return hashlib.blake2b(key_data, digest_size=16).hexdigest()
 
-    def _get_cached_screenshot(
+    async def _get_cached_screenshot(
         self, url: str, width: int, height: int
     ) -> Optional[bytes]:
         cache_key = self._get_cache_key(url, width, height)
-        cache_file = self.cache_dir / f"{cache_key}.jpg"
+        data = self._mem.get(cache_key)
+        if data is not None:
+            self._mem.move_to_end(cache_key)
+            return data
 
-        if cache_file.exists():
-            try:
-                with open(cache_file, "rb") as f:
-                    return f.read()
-            except Exception as e:
-                logger.warning(f"Failed to read cached screenshot: {e}")
+        cache_file = self.cache_dir / f"{cache_key}.{self._cache_ext}"
+
+        try:
+            data = await asyncio.to_thread(self._read_cache_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to read cached screenshot: {e}")
+            return None
 
-        return None
+        if data is not None:
+            self._remember(cache_key, data)
+        return data
 
-    def _cache_screenshot(self, url: str, width: int, height: int, screenshot: bytes):
+    def _remember(self, cache_key: str, data: bytes):
+        self._mem[cache_key] = data
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self._mem_max:
+            self._mem.popitem(last=False)
+
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Optional[bytes]:
+        try:
+            with open(cache_file, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    async def _cache_screenshot(
+        self, url: str, width: int, height: int, screenshot: bytes
+    ) -> bytes:
+        """Store a screenshot in the cache and return it as cached (re-encoded)."""
         cache_key = self._get_cache_key(url, width, height)
-        cache_file = self.cache_dir / f"{cache_key}.jpg"
+        cache_file = self.cache_dir / f"{cache_key}.{self._cache_ext}"
 
         try:
-            with open(cache_file, "wb") as f:
-                f.write(screenshot)
+            screenshot = await asyncio.to_thread(
+                self._reencode, screenshot, self.cache_quality
+            )
+        except Exception as e:
+            logger.warning(f"Failed to encode screenshot for cache: {e}")
+            return screenshot
+
+        self._remember(cache_key, screenshot)
 
-            self._cleanup_cache()
+        try:
+            await asyncio.to_thread(self._write_cache_file, cache_file, screenshot)
         except Exception as e:
             logger.warning(f"Failed to cache screenshot: {e}")
+            return screenshot
 
-    def _cleanup_cache(self):
-        cache_files = list(self.cache_dir.glob("*.jpg"))
-        if len(cache_files) > self.max_cache_size:
-            cache_files.sort(key=lambda x: x.stat().st_mtime)
-            for old_file in cache_files[: -self.max_cache_size]:
-                try:
-                    old_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to remove old cache file {old_file}: {e}")
+        self._index[cache_key] = (cache_file, time.time(), len(screenshot))
+        self._index.move_to_end(cache_key)
 
-    def _generate_placeholder(self, url: str, width: int, height: int) -> bytes:
-        from PIL import Image, ImageDraw, ImageFont
-        import io
+        evicted = []
+        while len(self._index) > self.max_cache_size:
+            _, (old_file, _, _) = self._index.popitem(last=False)
+            evicted.append(old_file)
+        if evicted:
+            await asyncio.to_thread(self._remove_cache_files, evicted)
 
-        img = Image.new("RGB", (width, height), color="#f0f0f0")
-        draw = ImageDraw.Draw(img)
+        return screenshot
 
-        try:
-            domain = urlparse(url).netloc
-        except:
-            domain = "Unknown"
+    def _reencode(self, screenshot: bytes, quality: int) -> bytes:
+        """
+        Re-encode a capture for the cache, which Playwright's encoder can't do itself.
 
-        text = f"Preview\n{domain}"
-        try:
-            font = ImageFont.load_default()
-        except:
-            font = None
+        JPEG output uses optimize (an extra Huffman pass) and progressive scans. Both
+        cost some encode time once, on write, and save bytes on every later read.
+        """
+        if self.cache_format == "webp":
+            return _encode_webp(screenshot, quality)
 
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        img = Image.open(io.BytesIO(screenshot))
+        out = io.BytesIO()
+        img.convert("RGB").save(
+            out, format="JPEG", quality=quality, optimize=True, progressive=True
+        )
+        return out.getvalue()
 
-        x = (width - text_width) // 2
-        y = (height - text_height) // 2
+    @staticmethod
+    def _write_cache_file(cache_file: Path, screenshot: bytes):
+        with open(cache_file, "wb") as f:
+            f.write(screenshot)
 
-        draw.text((x, y), text, fill="#666666", font=font)
+    @staticmethod
+    def _remove_cache_files(cache_files: List[Path]):
+        for old_file in cache_files:
+            try:
+                old_file.unlink()
+            except Exception as e:
+                logger.warning(f"Failed to remove old cache file {old_file}: {e}")
+
+    def _load_cache_index(self) -> "OrderedDict[str, tuple]":
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                key, _, ext = entry.name.rpartition(".")
+                if ext == self._cache_ext and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, key, Path(entry.path), stat.st_size))
+        entries.sort()
+        return OrderedDict(
+            (key, (path, mtime, size)) for mtime, key, path, size in entries
+        )
 
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format="JPEG", quality=85)
-        return img_byte_arr.getvalue()
+    def _generate_placeholder(self, url: str, width: int, height: int, fmt: str) -> bytes:
+        return _make_placeholder(_placeholder_domain(url), width, height, fmt)
 
 
 # Convenience functions for easy use
@@ -11,92 +11,84 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
 import base64
+import fnmatch
 from pathlib import Path
 from services.website_screenshot_service import WebsiteScreenshotService, ScreenshotAPI
+from utils.event_loop import install_fast_event_loop
 
+# Only write screenshots to disk when explicitly requested (SAVE_ARTIFACTS=1)
+SAVE = os.getenv("SAVE_ARTIFACTS") == "1"
 
-async def example_basic_screenshot():
+
+async def example_basic_screenshot(service: WebsiteScreenshotService):
     """Example: Basic screenshot functionality."""
     print("📸 Example 1: Basic Screenshot")
     print("-" * 40)
 
     url = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
-    async with WebsiteScreenshotService() as service:
-        # Take a basic screenshot
-        screenshot = await service.take_screenshot(
-            url=url, width=800, height=600, quality=90
-        )
-
-        # Save to file
-        output_path = Path("example_basic.jpg")
-        with open(output_path, "wb") as f:
-            f.write(screenshot)
+    # Take a basic screenshot; when saving, the service also writes it to path
+    output_path = Path("example_basic.jpg") if SAVE else None
+    screenshot = await service.take_screenshot(
+        url=url, width=800, height=600, quality=90, path=output_path
+    )
 
+    if output_path:
         print(f"✅ Screenshot saved: {output_path}")
-        print(f"📊 Size: {len(screenshot)} bytes")
+    print(f"📊 Size: {len(screenshot)} bytes")
 
 
-async def example_thumbnail():
+async def example_thumbnail(service: WebsiteScreenshotService):
     """Example: Thumbnail generation."""
     print("\n🖼️  Example 2: Thumbnail Generation")
     print("-" * 40)
 
     url = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
-    async with WebsiteScreenshotService() as service:
-        # Generate thumbnail
-        thumbnail = await service.take_thumbnail(
-            url=url, width=200, height=150, quality=85
-        )
-
-        # Save thumbnail
-        thumbnail_path = Path("example_thumbnail.jpg")
-        with open(thumbnail_path, "wb") as f:
-            f.write(thumbnail)
+    # Generate thumbnail, also written to path when saving
+    thumbnail_path = Path("example_thumbnail.jpg") if SAVE else None
+    thumbnail = await service.take_thumbnail(
+        url=url, width=200, height=150, quality=85, path=thumbnail_path
+    )
 
+    if thumbnail_path:
         print(f"✅ Thumbnail saved: {thumbnail_path}")
-        print(f"📊 Size: {len(thumbnail)} bytes")
+    print(f"📊 Size: {len(thumbnail)} bytes")
 
 
-async def example_full_page():
+async def example_full_page(service: WebsiteScreenshotService):
     """Example: Full page screenshot."""
     print("\n📄 Example 3: Full Page Screenshot")
     print("-" * 40)
 
     url = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
-    async with WebsiteScreenshotService() as service:
-        # Take full page screenshot
-        full_screenshot = await service.take_full_page_screenshot(
-            url=url, width=1200, quality=90
-        )
-
-        # Save full page screenshot
-        full_path = Path("example_full_page.jpg")
-        with open(full_path, "wb") as f:
-            f.write(full_screenshot)
+    # Take full page screenshot, also written to path when saving
+    full_path = Path("example_full_page.jpg") if SAVE else None
+    full_screenshot = await service.take_full_page_screenshot(
+        url=url, width=1200, quality=90, path=full_path
+    )
 
+    if full_path:
         print(f"✅ Full page screenshot saved: {full_path}")
-        print(f"📊 Size: {len(full_screenshot)} bytes")
+    print(f"📊 Size: {len(full_screenshot)} bytes")
 
 
-async def example_base64():
+async def example_base64(service: WebsiteScreenshotService):
     """Example: Base64 encoding for web use."""
     print("\n🔗 Example 4: Base64 Encoding")
     print("-" * 40)
 
     url = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
-    async with WebsiteScreenshotService() as service:
-        # Get base64 encoded screenshot
-        base64_screenshot = await service.take_screenshot_as_base64(
-            url=url, width=400, height=300, quality=85
-        )
+    # Get base64 encoded screenshot
+    data_url = await service.take_screenshot_as_base64(
+        url=url, data_url=True, width=400, height=300, quality=85
+    )
 
-        print(f"✅ Base64 screenshot generated")
-        print(f"📊 Length: {len(base64_screenshot)} characters")
-        print(f"🔗 Preview: data:image/jpeg;base64,{base64_screenshot[:50]}...")
+    print(f"✅ Base64 screenshot generated")
+    print(f"📊 Length: {len(data_url)} characters")
+    print(f"🔗 Preview: {data_url[:73]}...")
 
 
 async def example_caching():
@@ -124,7 +116,7 @@ async def example_caching():
         print("❌ Cache not working - screenshots are different")
 
 
-async def example_multiple_urls():
+async def example_multiple_urls(service: WebsiteScreenshotService):
     """Example: Processing multiple URLs."""
     print("\n🌐 Example 6: Multiple URLs")
     print("-" * 40)
@@ -135,35 +127,48 @@ async def example_multiple_urls():
         "https://jsonplaceholder.typicode.com",
     ]
 
-    async with WebsiteScreenshotService() as service:
-        for i, url in enumerate(urls, 1):
-            try:
-                print(f"🔄 Processing URL {i}: {url}")
-                screenshot = await service.take_thumbnail(url, width=200, height=150)
-
-                output_path = Path(f"example_url_{i}.jpg")
-                with open(output_path, "wb") as f:
-                    f.write(screenshot)
+    # Limit how many pages are open in the browser at once
+    semaphore = asyncio.Semaphore(3)
 
-                print(f"✅ Screenshot {i} saved: {output_path}")
-                print(f"📊 Size: {len(screenshot)} bytes")
+    # When saving, each capture is also written to its output path
+    output_paths = [
+        Path(f"example_url_{i}.jpg") if SAVE else None for i in range(1, len(urls) + 1)
+    ]
 
-            except Exception as e:
-                print(f"❌ Failed to screenshot {url}: {e}")
+    async def take(url, output_path):
+        async with semaphore:
+            return await service.take_thumbnail(
+                url, width=200, height=150, path=output_path
+            )
+
+    print(f"🔄 Processing {len(urls)} URLs concurrently...")
+    results = await asyncio.gather(
+        *(take(url, path) for url, path in zip(urls, output_paths)),
+        return_exceptions=True,
+    )
+
+    for i, (url, output_path, screenshot) in enumerate(
+        zip(urls, output_paths, results), 1
+    ):
+        if isinstance(screenshot, BaseException):
+            print(f"❌ Failed to screenshot {url}: {screenshot}")
+            continue
+
+        if output_path:
+            print(f"✅ Screenshot {i} saved: {output_path}")
+        print(f"📊 Size: {len(screenshot)} bytes")
 
 
 async def example_custom_settings():
-    """Example: Custom browser and screenshot settings."""
+    """Example: Custom screenshot settings."""
     print("\n⚙️  Example 7: Custom Settings")
     print("-" * 40)
 
     url = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
-    service = WebsiteScreenshotService(headless=True, timeout=45000)  # 45 seconds timeout
-
-    await service.start()
-
-    try:
+    # Custom browser settings need their own service: headless, 45 second timeout
+    custom_path = Path("example_custom.jpg") if SAVE else None
+    async with WebsiteScreenshotService(headless=True, timeout=45000) as service:
         screenshot = await service.take_screenshot(
             url=url,
             width=1024,
@@ -172,34 +177,28 @@ async def example_custom_settings():
             format="jpeg",
             wait_time=3000,  # Wait 3 seconds after page load
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            path=custom_path,
         )
 
-        custom_path = Path("example_custom.jpg")
-        with open(custom_path, "wb") as f:
-            f.write(screenshot)
-
+    if custom_path:
         print(f"✅ Custom screenshot saved: {custom_path}")
-        print(f"📊 Size: {len(screenshot)} bytes")
-        print(f"⚙️  Settings: 1024x768, 95% quality, 3s wait")
-
-    finally:
-        await service.stop()
+    print(f"📊 Size: {len(screenshot)} bytes")
+    print(f"⚙️  Settings: 1024x768, 95% quality, 3s wait, 45s timeout")
 
 
-async def example_error_handling():
+async def example_error_handling(service: WebsiteScreenshotService):
     """Example: Error handling and fallbacks."""
     print("\n🛡️  Example 8: Error Handling")
     print("-" * 40)
 
     invalid_url = "https://this-domain-does-not-exist-12345.com"
 
-    async with WebsiteScreenshotService() as service:
-        try:
-            print(f"🔄 Attempting to screenshot invalid URL: {invalid_url}")
-            screenshot = await service.take_screenshot(invalid_url, width=200, height=150)
-            print(f"❌ Unexpected success with invalid URL")
-        except Exception as e:
-            print(f"✅ Correctly handled invalid URL: {type(e).__name__}")
+    try:
+        print(f"🔄 Attempting to screenshot invalid URL: {invalid_url}")
+        screenshot = await service.take_screenshot(invalid_url, width=200, height=150)
+        print(f"❌ Unexpected success with invalid URL")
+    except Exception as e:
+        print(f"✅ Correctly handled invalid URL: {type(e).__name__}")
 
     api = ScreenshotAPI()
     try:
@@ -216,21 +215,35 @@ async def main():
     print("=" * 50)
 
     try:
-        await example_basic_screenshot()
-        # await example_thumbnail()
-        # await example_full_page()
-        # await example_base64()
+        # One browser launch shared by every example
+        async with WebsiteScreenshotService() as service:
+            # Independent examples run concurrently against the shared browser
+            await asyncio.gather(
+                example_basic_screenshot(service),
+                # example_thumbnail(service),
+                # example_full_page(service),
+                # example_base64(service),
+                # example_multiple_urls(service),
+                # example_error_handling(service),
+            )
+
+        # These examples configure their own service or cache directory, so they
+        # run on their own
         # await example_caching()
-        # await example_multiple_urls()
         # await example_custom_settings()
-        # await example_error_handling()
 
         print("\n" + "=" * 50)
         print("🎉 All examples completed successfully!")
         print("\nGenerated files:")
 
-        for file_path in Path(".").glob("example_*.jpg"):
-            print(f"  📄 {file_path}")
+        with os.scandir(".") as entries:
+            files = [
+                entry.name
+                for entry in entries
+                if entry.is_file() and fnmatch.fnmatch(entry.name, "example_*.jpg")
+            ]
+        for file_name in files:
+            print(f"  📄 {file_name}")
 
         print("\nNext steps:")
         print("  • Check the generated image files")
@@ -243,4 +256,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     asyncio.run(main())
@@ -6,10 +6,14 @@ This script runs all existing test scripts and provides comprehensive reporting.
 
 import sys
 import os
+import contextlib
+import http.client
+import importlib
 import subprocess
+import tempfile
 import time
-import requests
 import asyncio
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
@@ -18,14 +22,15 @@ from enum import Enum
 # Add the parent directory to Python path so we can import from packages
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tests import (
-    test_screenshot_service,
-    test_browser_pool,
-    test_pool_simple,
-    test_windows_cleanup,
-    example_usage,
-    test_api_connection,
-)
+from utils.event_loop import install_fast_event_loop
+
+
+# Captured test output is kept in memory up to this size before spilling to disk
+OUTPUT_SPOOL_SIZE = 64 * 1024
+
+PROGRESS_BAR_LENGTH = 30
+# Minimum seconds between progress bar flushes
+PROGRESS_FLUSH_INTERVAL = 0.05
 
 
 class TestStatus(Enum):
@@ -53,70 +58,98 @@ class TestRunner:
 
     def __init__(self):
         self.results: List[TestResult] = []
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
+        self._last_progress_flush = 0.0
+        self._connections: Dict[Tuple[str, int], http.client.HTTPConnection] = {}
 
         self.tests = [
             {
                 "name": "Screenshot Service Test",
-                "module": test_screenshot_service,
+                "module_name": "tests.test_screenshot_service",
                 "function": "test_screenshot_service",
                 "requires_servers": False,
                 "description": "Tests the website screenshot service with proper cleanup",
             },
             {
                 "name": "Browser Pool Test",
-                "module": test_browser_pool,
+                "module_name": "tests.test_browser_pool",
                 "function": "test_browser_pool",
                 "requires_servers": False,
                 "description": "Tests browser pool functionality and concurrent requests",
             },
             {
                 "name": "Simple Pool Test",
-                "module": test_pool_simple,
+                "module_name": "tests.test_pool_simple",
                 "function": "test_simple_pool",
                 "requires_servers": False,
                 "description": "Simple browser pool functionality test",
             },
             {
                 "name": "Windows Cleanup Test",
-                "module": test_windows_cleanup,
+                "module_name": "tests.test_windows_cleanup",
                 "function": "test_cleanup",
                 "requires_servers": False,
                 "description": "Tests Windows asyncio cleanup fix",
             },
+            {
+                "name": "URL Normalization Test",
+                "module_name": "tests.test_url_normalization",
+                "function": "test_url_normalization",
+                "requires_servers": False,
+                "description": "Checks URL normalization used for screenshot cache keys",
+            },
             {
                 "name": "API Connection Test",
-                "module": test_api_connection,
+                "module_name": "tests.test_api_connection",
                 "function": "main",
                 "requires_servers": True,
                 "description": "Tests API endpoints (requires backend and frontend running)",
             },
             {
                 "name": "Example Usage Test",
-                "module": example_usage,
+                "module_name": "tests.example_usage",
                 "function": "main",
                 "requires_servers": False,
                 "description": "Runs example usage demonstrations",
             },
         ]
 
-    def check_servers_running(self) -> Tuple[bool, bool]:
-        backend_running = False
-        frontend_running = False
-
-        try:
-            # Check backend (FastAPI)
-            response = requests.get("http://localhost:8000/health", timeout=2)
-            backend_running = response.status_code == 200
-        except:
-            pass
+    def _resolve(self, test_info: Dict) -> None:
+        # Test modules are imported on first use and the entry point is cached,
+        # so tests that are skipped never pay their import cost
+        if "callable" in test_info:
+            return
+
+        module = importlib.import_module(test_info["module_name"])
+        func = getattr(module, test_info["function"], None)
+        if func is None:
+            raise AttributeError(f"Function {test_info['function']} not found in module")
+        test_info["callable"] = func
+        test_info["is_coro"] = asyncio.iscoroutinefunction(func)
+
+    def _probe(self, host: str, port: int, path: str) -> bool:
+        # Connections are kept on the runner so repeated probes reuse them
+        conn = self._connections.get((host, port))
+        if conn is None:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            self._connections[(host, port)] = conn
 
         try:
-            # Check frontend (Svelte dev server)
-            response = requests.get("http://localhost:5173", timeout=2)
-            frontend_running = response.status_code == 200
-        except:
-            pass
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            return response.status == 200
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            return False
+
+    async def check_servers_running(self) -> Tuple[bool, bool]:
+        # Probe backend (FastAPI) and frontend (Svelte dev server) concurrently,
+        # off the event loop thread
+        backend_running, frontend_running = await asyncio.gather(
+            asyncio.to_thread(self._probe, "localhost", 8000, "/health"),
+            asyncio.to_thread(self._probe, "localhost", 5173, "/"),
+        )
 
         return backend_running, frontend_running
 
@@ -130,16 +163,19 @@ class TestRunner:
 
     def print_progress(self, current: int, total: int, test_name: str):
         progress = (current / total) * 100
-        bar_length = 30
-        filled_length = int(bar_length * current // total)
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
-
-        print(
-            f"\r🔄 Progress: [{bar}] {progress:.1f}% ({current}/{total}) - {test_name}",
-            end="",
-            flush=True,
+        filled_length = PROGRESS_BAR_LENGTH * current // total
+        bar = ("█" * filled_length).ljust(PROGRESS_BAR_LENGTH, "░")
+
+        sys.stdout.write(
+            f"\r🔄 Progress: [{bar}] {progress:.1f}% ({current}/{total}) - {test_name}"
         )
 
+        # Only flush on completion or when the last flush is old enough
+        now = time.perf_counter()
+        if current == total or now - self._last_progress_flush > PROGRESS_FLUSH_INTERVAL:
+            sys.stdout.flush()
+            self._last_progress_flush = now
+
     def print_test_result(self, result: TestResult):
         status_icons = {
             TestStatus.PASSED: "✅",
@@ -164,132 +200,57 @@ class TestRunner:
         elif result.status == TestStatus.PASSED:
             print(f"   ✅ Passed")
 
-    async def run_async_test(self, test_info: Dict) -> TestResult:
+    async def run_test(self, test_info: Dict) -> TestResult:
         name = test_info["name"]
-        module = test_info["module"]
-        function_name = test_info["function"]
         requires_servers = test_info["requires_servers"]
 
-        start_time = time.time()
-        output = ""
-        error = None
-
-        try:
-            import io
-            import contextlib
-
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                if function_name == "main":
-                    if hasattr(module, function_name):
-                        if asyncio.iscoroutinefunction(getattr(module, function_name)):
-                            await getattr(module, function_name)()
-                        else:
-                            getattr(module, function_name)()
-                    else:
-                        raise AttributeError(
-                            f"Function {function_name} not found in module"
-                        )
-                else:
-                    if hasattr(module, function_name):
-                        func = getattr(module, function_name)
-                        if asyncio.iscoroutinefunction(func):
-                            await func()
-                        else:
-                            func()
-                    else:
-                        raise AttributeError(
-                            f"Function {function_name} not found in module"
-                        )
-
-            output = f.getvalue()
-            duration = time.time() - start_time
-
-            return TestResult(
-                name=name,
-                status=TestStatus.PASSED,
-                duration=duration,
-                output=output,
-                requires_servers=requires_servers,
-            )
+        # A test may run for a long time, so its progress line is always shown
+        # before it starts; only the flushes between quick steps are throttled
+        sys.stdout.flush()
+        self._last_progress_flush = time.perf_counter()
 
-        except Exception as e:
-            duration = time.time() - start_time
-            error = str(e)
-
-            return TestResult(
-                name=name,
-                status=TestStatus.FAILED,
-                duration=duration,
-                output=output,
-                error=error,
-                requires_servers=requires_servers,
-            )
+        start_time = time.perf_counter()
 
-    def run_sync_test(self, test_info: Dict) -> TestResult:
-        name = test_info["name"]
-        module = test_info["module"]
-        function_name = test_info["function"]
-        requires_servers = test_info["requires_servers"]
+        # Small outputs stay in memory, large ones spill to a temp file
+        with tempfile.SpooledTemporaryFile(max_size=OUTPUT_SPOOL_SIZE, mode="w+") as f:
+            try:
+                with contextlib.redirect_stdout(f):
+                    self._resolve(test_info)
+                    if test_info["is_coro"]:
+                        await test_info["callable"]()
+                    else:
+                        test_info["callable"]()
 
-        start_time = time.time()
-        output = ""
-        error = None
+                duration = time.perf_counter() - start_time
 
-        try:
-            # Capture stdout to get test output
-            import io
-            import contextlib
-
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                if function_name == "main":
-                    # For main functions, we need to run them directly
-                    if hasattr(module, function_name):
-                        getattr(module, function_name)()
-                    else:
-                        raise AttributeError(
-                            f"Function {function_name} not found in module"
-                        )
-                else:
-                    # For sync functions, call them directly
-                    if hasattr(module, function_name):
-                        getattr(module, function_name)()
-                    else:
-                        raise AttributeError(
-                            f"Function {function_name} not found in module"
-                        )
-
-            output = f.getvalue()
-            duration = time.time() - start_time
-
-            return TestResult(
-                name=name,
-                status=TestStatus.PASSED,
-                duration=duration,
-                output=output,
-                requires_servers=requires_servers,
-            )
+                # Output of passing tests is discarded
+                return TestResult(
+                    name=name,
+                    status=TestStatus.PASSED,
+                    duration=duration,
+                    output="",
+                    requires_servers=requires_servers,
+                )
 
-        except Exception as e:
-            duration = time.time() - start_time
-            error = str(e)
-
-            return TestResult(
-                name=name,
-                status=TestStatus.FAILED,
-                duration=duration,
-                output=output,
-                error=error,
-                requires_servers=requires_servers,
-            )
+            except Exception as e:
+                duration = time.perf_counter() - start_time
+                f.seek(0)
+
+                return TestResult(
+                    name=name,
+                    status=TestStatus.FAILED,
+                    duration=duration,
+                    output=f.read(),
+                    error=str(e),
+                    requires_servers=requires_servers,
+                )
 
     async def run_tests(self, skip_server_dependent: bool = False) -> List[TestResult]:
         """Run all tests."""
         self.print_header()
 
         # Check server status
-        backend_running, frontend_running = self.check_servers_running()
+        backend_running, frontend_running = await self.check_servers_running()
 
         if backend_running or frontend_running:
             print(f"🌐 Server Status:")
@@ -344,18 +305,9 @@ class TestRunner:
             self.print_progress(i, len(self.tests), test_info["name"])
 
             # Run the test
+            start_time = time.perf_counter()
             try:
-                if test_info["function"] in [
-                    "test_screenshot_service",
-                    "test_browser_pool",
-                    "test_simple_pool",
-                    "test_cleanup",
-                ]:
-                    # These are async functions
-                    result = await self.run_async_test(test_info)
-                else:
-                    # These are sync functions (main functions)
-                    result = self.run_sync_test(test_info)
+                result = await self.run_test(test_info)
 
                 self.results.append(result)
                 self.print_test_result(result)
@@ -364,7 +316,7 @@ class TestRunner:
                 result = TestResult(
                     name=test_info["name"],
                     status=TestStatus.ERROR,
-                    duration=time.time() - time.time(),
+                    duration=time.perf_counter() - start_time,
                     output="",
                     error=f"Test runner error: {str(e)}",
                     requires_servers=test_info["requires_servers"],
@@ -376,16 +328,22 @@ class TestRunner:
 
     def print_summary(self):
         """Print test summary."""
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
 
         print("\n" + "=" * 60)
         print("📊 TEST SUMMARY")
         print("=" * 60)
 
-        # Count results by status
-        status_counts = {}
-        for status in TestStatus:
-            status_counts[status] = len([r for r in self.results if r.status == status])
+        # Count results by status and partition failed/skipped tests in one pass
+        status_counts: Counter = Counter()
+        failed_tests = []
+        skipped_tests = []
+        for r in self.results:
+            status_counts[r.status] += 1
+            if r.status in (TestStatus.FAILED, TestStatus.ERROR):
+                failed_tests.append(r)
+            elif r.status == TestStatus.SKIPPED:
+                skipped_tests.append(r)
 
         print(f"⏱️  Total time: {total_time:.2f}s")
         print(f"📋 Total tests: {len(self.results)}")
@@ -395,16 +353,12 @@ class TestRunner:
         print(f"💥 Errors: {status_counts[TestStatus.ERROR]}")
 
         # Show failed tests
-        failed_tests = [
-            r for r in self.results if r.status in [TestStatus.FAILED, TestStatus.ERROR]
-        ]
         if failed_tests:
             print(f"\n❌ Failed Tests:")
             for result in failed_tests:
                 print(f"   • {result.name}: {result.error}")
 
         # Show skipped tests
-        skipped_tests = [r for r in self.results if r.status == TestStatus.SKIPPED]
         if skipped_tests:
             print(f"\n⏭️  Skipped Tests:")
             for result in skipped_tests:
@@ -454,4 +408,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     asyncio.run(main())
@@ -5,20 +5,35 @@ This helps diagnose connection issues between frontend and backend.
 """
 
 import json
+import os
+import socket
 import sys
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 TEST_URL = "https://www.noahpinion.blog/p/tokyo-is-the-new-paris"
 
+# Request parameters built once; requests handles query-string encoding of TEST_URL
+LINKS_PARAMS = {"url": TEST_URL}
+SCREENSHOT_PARAMS = {"url": TEST_URL, "width": 200, "height": 150, "quality": 85}
+PROXY_SCREENSHOT_PARAMS = {"url": TEST_URL, "width": 100, "height": 100}
+
+# Shared session so every test reuses resolved, kept-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Only write returned images to disk when explicitly requested (SAVE_ARTIFACTS=1)
+SAVE = os.getenv("SAVE_ARTIFACTS") == "1"
+
 
 def test_health_endpoint():
     print("🏥 Testing health endpoint...")
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{API_BASE_URL}/health", timeout=5)
         if response.status_code == 200:
             print("✅ Health endpoint working")
             print(f"   Response: {response.json()}")
@@ -34,7 +49,7 @@ def test_health_endpoint():
 def test_links_endpoint():
     print("\n🔗 Testing links endpoint...")
     try:
-        response = requests.get(f"{API_BASE_URL}/links?url={TEST_URL}", timeout=10)
+        response = SESSION.get(f"{API_BASE_URL}/links", params=LINKS_PARAMS, timeout=10)
         if response.status_code == 200:
             data = response.json()
             print("✅ Links endpoint working")
@@ -53,18 +68,25 @@ def test_links_endpoint():
 def test_screenshot_endpoint():
     print("\n📸 Testing screenshot endpoint...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/screenshot",
-            json={"url": TEST_URL, "width": 200, "height": 150, "quality": 85},
+            json=SCREENSHOT_PARAMS,
             timeout=30,
         )
         if response.status_code == 200:
             content_type = response.headers.get("content-type", "")
             content_length = len(response.content)
-            # Save the image that's returned
-            with open("test_screenshot.jpg", "wb") as f:
-                f.write(response.content)
-            print("   Screenshot saved as test_screenshot.jpg")
+            if content_length == 0:
+                print("❌ Screenshot endpoint returned an empty body")
+                return False
+            # Save the image that's returned, named for the format the API reports
+            # (cached screenshots come back in the cache format, WebP by default)
+            if SAVE:
+                image_type = content_type.split(";")[0].strip()
+                filename = f"test_screenshot.{image_type.rpartition('/')[2] or 'img'}"
+                with open(filename, "wb") as f:
+                    f.write(response.content)
+                print(f"   Screenshot saved as {filename}")
             print("✅ Screenshot endpoint working")
             print(f"   Content-Type: {content_type}")
             print(f"   Content-Length: {content_length} bytes")
@@ -81,9 +103,9 @@ def test_screenshot_endpoint():
 def test_screenshot_thumbnail():
     print("\n🖼️  Testing thumbnail endpoint...")
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE_URL}/screenshot/thumbnail",
-            json={"url": TEST_URL, "width": 200, "height": 150, "quality": 85},
+            json=SCREENSHOT_PARAMS,
             timeout=30,
         )
         if response.status_code == 200:
@@ -105,7 +127,7 @@ def test_screenshot_thumbnail():
 def test_cors_headers():
     print("\n🌐 Testing CORS headers...")
     try:
-        response = requests.options(f"{API_BASE_URL}/health", timeout=5)
+        response = SESSION.options(f"{API_BASE_URL}/health", timeout=5)
         cors_headers = {
             "Access-Control-Allow-Origin": response.headers.get(
                 "Access-Control-Allow-Origin"
@@ -133,7 +155,7 @@ def test_proxy_endpoints():
 
     try:
         # Test health through proxy
-        response = requests.get(f"{proxy_base}/health", timeout=5)
+        response = SESSION.get(f"{proxy_base}/health", timeout=5)
         if response.status_code == 200:
             print("✅ Proxy health endpoint working")
         else:
@@ -141,9 +163,9 @@ def test_proxy_endpoints():
             return False
 
         # Test screenshot through proxy
-        response = requests.post(
+        response = SESSION.post(
             f"{proxy_base}/screenshot",
-            json={"url": TEST_URL, "width": 100, "height": 100},
+            json=PROXY_SCREENSHOT_PARAMS,
             timeout=30,
         )
         if response.status_code == 200:
@@ -164,6 +186,14 @@ def main():
     print("🚀 API Connection Test")
     print("=" * 40)
 
+    # Fail fast instead of waiting out every request timeout when the API is down
+    api = urlparse(API_BASE_URL)
+    try:
+        socket.create_connection((api.hostname, api.port), timeout=0.5).close()
+    except OSError as e:
+        print(f"❌ API not running at {API_BASE_URL}: {e}")
+        return 1
+
     tests = [
         test_health_endpoint,
         test_links_endpoint,
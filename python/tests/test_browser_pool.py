@@ -16,6 +16,7 @@ from services.website_screenshot_service import (
     shutdown_browser_pool,
     ScreenshotAPI,
 )
+from utils.event_loop import install_fast_event_loop
 
 
 async def test_browser_pool():
@@ -31,25 +32,39 @@ async def test_browser_pool():
         "https://www.reddit.com",
     ]
 
-    async def take_screenshot(url):
-        # Use the same pool size as the main pool
-        api = ScreenshotAPI(pool_size=2)
-        start_time = time.time()
-
-        try:
-            screenshot = await api.get_screenshot(url, width=300, height=200)
-            duration = time.time() - start_time
-            print(f"Screenshot of {url}: {len(screenshot)} bytes in {duration:.2f}s")
-            return screenshot
-        except Exception as e:
-            print(f"Error taking screenshot of {url}: {e}")
-            return None
+    # One shared API with pool_size workers pulling URLs from a queue
+    api = ScreenshotAPI(pool_size=2)
+    queue: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+
+    results = []
+
+    async def screenshot_worker():
+        while not queue.empty():
+            url = queue.get_nowait()
+            start_time = time.time()
+            try:
+                screenshot = await api.get_screenshot(url, width=300, height=200)
+                duration = time.time() - start_time
+                print(f"Screenshot of {url}: {len(screenshot)} bytes in {duration:.2f}s")
+                results.append(screenshot)
+            except Exception as e:
+                print(f"Error taking screenshot of {url}: {e}")
+                results.append(None)
+            finally:
+                queue.task_done()
 
     print("\nTesting concurrent requests...")
     start_time = time.time()
 
-    tasks = [take_screenshot(url) for url in urls]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    if sys.version_info >= (3, 11):
+        # TaskGroup cancels the remaining workers if one of them fails
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(api.pool_size):
+                tg.create_task(screenshot_worker())
+    else:
+        await asyncio.gather(*(screenshot_worker() for _ in range(api.pool_size)))
 
     total_time = time.time() - start_time
     print(f"Completed {len(results)} requests in {total_time:.2f}s")
@@ -57,18 +72,21 @@ async def test_browser_pool():
     print(f"\nPool health after requests: {await pool.health_check()}")
 
     print("\nTesting pool exhaustion...")
-    browsers = []
+    max_browsers = 5
+    browsers = [None] * max_browsers
+    count = 0
     try:
-        for i in range(5):
+        for i in range(max_browsers):
             browser = await pool.get_browser()
             if browser:
-                browsers.append(browser)
+                browsers[count] = browser
+                count += 1
                 print(f"Got browser {i+1}")
             else:
                 print(f"Could not get browser {i+1} - pool exhausted")
                 break
 
-        for browser in browsers:
+        for browser in browsers[:count]:
             await pool.return_browser(browser)
             print("Returned browser to pool")
 
@@ -98,12 +116,19 @@ async def test_screenshot_api():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     try:
-        # Run tests in a single event loop to avoid resource conflicts
+        # Run tests and pool cleanup in a single event loop to avoid resource
+        # conflicts and a second loop start-up just for shutdown
         async def run_all_tests():
-            await test_browser_pool()
-            await test_screenshot_api()
-            print("\nAll tests completed successfully!")
+            try:
+                await test_browser_pool()
+                await test_screenshot_api()
+                print("\nAll tests completed successfully!")
+            finally:
+                # Ensure cleanup happens
+                await shutdown_browser_pool()
 
         asyncio.run(run_all_tests())
     except KeyboardInterrupt:
@@ -113,9 +138,3 @@ if __name__ == "__main__":
         import traceback
 
         traceback.print_exc()
-    finally:
-        # Ensure cleanup happens
-        try:
-            asyncio.run(shutdown_browser_pool())
-        except:
-            pass
@@ -5,12 +5,20 @@ Run this after starting your FastAPI server.
 """
 
 import json
+import socket
+import sys
 from typing import Any, Dict
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000"
 
+# Shared session so every request reuses resolved, kept-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 
 def test_kagi_search_endpoint():
     """Test the /kagi-search endpoint with different parameters."""
@@ -23,7 +31,7 @@ def test_kagi_search_endpoint():
     }
 
     try:
-        response = requests.post(f"{BASE_URL}/kagi-search", json=test_request)
+        response = SESSION.post(f"{BASE_URL}/kagi-search", json=test_request)
         print(f"Status Code: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -48,7 +56,7 @@ def test_kagi_search_endpoint():
     }
 
     try:
-        response = requests.post(f"{BASE_URL}/kagi-search", json=test_request_2)
+        response = SESSION.post(f"{BASE_URL}/kagi-search", json=test_request_2)
         print(f"Status Code: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -73,7 +81,7 @@ def test_kagi_search_endpoint():
     }
 
     try:
-        response = requests.post(f"{BASE_URL}/kagi-search", json=test_request_3)
+        response = SESSION.post(f"{BASE_URL}/kagi-search", json=test_request_3)
         print(f"Status Code: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -93,7 +101,7 @@ def test_health_endpoint():
     """Test the health endpoint to make sure the server is running."""
     print("🏥 Testing health endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(f"{BASE_URL}/health")
         print(f"Status Code: {response.status_code}")
         if response.status_code == 200:
             result = response.json()
@@ -110,6 +118,14 @@ if __name__ == "__main__":
     print("🚀 Testing Kagi Search API Endpoint")
     print("=" * 80)
 
+    # Fail fast instead of waiting out every request when the API is down
+    api = urlparse(BASE_URL)
+    try:
+        socket.create_connection((api.hostname, api.port), timeout=0.5).close()
+    except OSError as e:
+        print(f"❌ API not running at {BASE_URL}: {e}")
+        sys.exit(1)
+
     test_health_endpoint()
     print("\n" + "=" * 80 + "\n")
 
@@ -16,6 +16,7 @@ from services.website_screenshot_service import (
     shutdown_browser_pool,
     ScreenshotAPI,
 )
+from utils.event_loop import install_fast_event_loop
 
 
 async def test_simple_pool():
@@ -45,8 +46,11 @@ async def test_simple_pool():
     print(f"\nTaking {len(urls)} screenshots...")
     start_time = time.time()
 
-    for i, url in enumerate(urls):
-        screenshot = await api.get_screenshot(url, width=200, height=150)
+    # Dispatch concurrently so both pooled browsers are in use at once
+    screenshots = await asyncio.gather(
+        *(api.get_screenshot(url, width=200, height=150) for url in urls)
+    )
+    for i, screenshot in enumerate(screenshots):
         print(f"Screenshot {i+1}: {len(screenshot)} bytes")
 
     total_time = time.time() - start_time
@@ -59,6 +63,8 @@ async def test_simple_pool():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     try:
         asyncio.run(test_simple_pool())
     except KeyboardInterrupt:
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import platform
 from services.website_screenshot_service import WebsiteScreenshotService, ScreenshotAPI
+from utils.event_loop import install_fast_event_loop
 
 
 async def test_screenshot_service():
@@ -66,6 +67,8 @@ async def test_screenshot_service():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     try:
         asyncio.run(test_screenshot_service())
     except KeyboardInterrupt:
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Checks the URL normalization used to key the screenshot cache.
+"""
+
+import sys
+import os
+
+# Add the parent directory to Python path so we can import from packages
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.url import normalize_url
+
+
+def test_url_normalization():
+    """Test that equivalent URLs share a key and SPA routes do not."""
+    print("Testing URL normalization...")
+
+    cases = [
+        ("HTTPS://Example.COM/Path", "https://example.com/Path"),
+        ("https://example.com/?b=2&a=1", "https://example.com/?a=1&b=2"),
+        ("https://example.com/page#section", "https://example.com/page"),
+        ("https://example.com/#/settings", "https://example.com/#/settings"),
+        ("https://example.com/#!/inbox", "https://example.com/#!/inbox"),
+    ]
+    for url, expected in cases:
+        result = normalize_url(url)
+        assert result == expected, f"{url!r} -> {result!r}, expected {expected!r}"
+        print(f"   {url} -> {result}")
+
+    assert normalize_url("https://example.com/#/a") != normalize_url(
+        "https://example.com/#/b"
+    ), "hash routes must not collide"
+
+    print("✅ URL normalization test passed")
+
+
+if __name__ == "__main__":
+    test_url_normalization()
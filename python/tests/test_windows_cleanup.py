@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import asyncio
 import platform
 from services.website_screenshot_service import WebsiteScreenshotService
+from utils.event_loop import install_fast_event_loop
 
 
 async def test_cleanup():
@@ -31,4 +32,6 @@ async def test_cleanup():
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()
+
     asyncio.run(test_cleanup())
@@ -16,8 +16,8 @@ def check_python_version():
     version = sys.version_info
     print(f"Python version: {version.major}.{version.minor}.{version.micro}")
 
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("❌ Python 3.8+ required")
+    if version.major < 3 or (version.major == 3 and version.minor < 9):
+        print("❌ Python 3.9+ required")
         return False
     else:
         print("✅ Python version is compatible")
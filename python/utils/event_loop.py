@@ -0,0 +1,28 @@
+"""
+Event loop helpers for the test and example entry points.
+"""
+
+import asyncio
+import platform
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop as the asyncio event loop policy when it is available.
+
+    uvloop is POSIX-only, so on Windows the Proactor policy set by the
+    screenshot service is left in place.
+
+    Returns:
+        bool: True if uvloop was installed
+    """
+    if platform.system() == "Windows":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
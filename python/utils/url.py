@@ -0,0 +1,30 @@
+"""
+URL helpers shared by the screenshot cache.
+"""
+
+import functools
+from urllib.parse import urlsplit, urlunsplit
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache keying.
+
+    The scheme and host are lowercased and query parameters are sorted. The
+    fragment is dropped unless it looks like a client-side route (``#/...`` or
+    ``#!...``), since hash-routed single page apps render a different page for
+    each of those.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Normalized URL
+    """
+    parts = urlsplit(url)
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, fragment)
+    )